@@ -6,10 +6,151 @@ Handles parsing of .xlsm files to extract:
 2. Demand data from "Consolidated Data" sheet
 """
 
-import pandas as pd
-from typing import Dict, List, Any, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple, Union
+import copy
 import re
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+
+# pandas/numpy are imported inside the functions that need them so that
+# importing this module (and /api/health, /api/demo) stays stdlib-only
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+# openpyxl options for streaming reads: skip the full cell object graph,
+# read cached formula values and ignore external workbook links. These match
+# pandas' own openpyxl defaults; passing them just makes the mode explicit.
+OPENPYXL_READ_OPTIONS = {"read_only": True, "data_only": True, "keep_links": False}
+
+# Recently parsed workbooks, keyed by content fingerprint (most recent last)
+PARSE_CACHE_SIZE = 8
+_parse_cache: "OrderedDict[Tuple[str, int], Dict[str, Any]]" = OrderedDict()
+
+# Canonical month order; every month key the parsers emit is one of these
+MONTH_ORDER = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+# Month header pattern, e.g. 'July Capacity', 'August Hours'
+MONTH_PATTERN = re.compile(
+    r'(January|February|March|April|May|June|July|August|September|October|November|December)\s*(Capacity|Hours|Forecast)?',
+    re.IGNORECASE
+)
+MONTH_ABBREV = {
+    "january": "Jan", "february": "Feb", "march": "Mar", "april": "Apr",
+    "may": "May", "june": "Jun", "july": "Jul", "august": "Aug",
+    "september": "Sep", "october": "Oct", "november": "Nov", "december": "Dec"
+}
+
+
+@lru_cache(maxsize=None)
+def calamine_available() -> bool:
+    """
+    Check whether pandas can use the Rust-backed calamine engine
+    (pandas >= 2.2 with python-calamine installed).
+    """
+    import importlib.util
+    import pandas as pd
+    
+    version = tuple(int(part) for part in pd.__version__.split(".")[:2])
+    return version >= (2, 2) and importlib.util.find_spec("python_calamine") is not None
+
+
+def openpyxl_engine_kwargs(reader: Any) -> Dict[str, Any]:
+    """
+    Return the engine kwargs to pass to `reader` (pd.read_excel or
+    pd.ExcelFile) for openpyxl reads, or none at all on pandas releases
+    where it doesn't accept engine_kwargs.
+    """
+    import inspect
+    
+    if "engine_kwargs" in inspect.signature(reader).parameters:
+        return {"engine_kwargs": OPENPYXL_READ_OPTIONS}
+    return {}
+
+
+def open_workbook(file_path: str) -> pd.ExcelFile:
+    """
+    Open a workbook once so several sheet reads can share it.
+    
+    Uses calamine when available, otherwise openpyxl in read-only mode.
+    """
+    import pandas as pd
+    
+    if calamine_available():
+        return pd.ExcelFile(file_path, engine='calamine')
+    return pd.ExcelFile(file_path, engine='openpyxl', **openpyxl_engine_kwargs(pd.ExcelFile))
+
+
+def read_sheet(source: Union[str, pd.ExcelFile], sheet_name: str,
+               nrows: Optional[int] = None,
+               usecols: Optional[List[int]] = None,
+               dtype: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Read a single sheet into a DataFrame.
+    
+    `source` is a file path or a workbook from open_workbook(), which avoids
+    re-opening the file and re-reading its shared strings for every sheet.
+    Paths use calamine when available, otherwise openpyxl in read-only mode.
+    Only the requested sheet is read; other sheets are never walked.
+    """
+    import pandas as pd
+    
+    if isinstance(source, pd.ExcelFile):
+        return pd.read_excel(
+            source,
+            sheet_name=sheet_name,
+            nrows=nrows,
+            usecols=usecols,
+            dtype=dtype
+        )
+    
+    file_path = source
+    if calamine_available():
+        return pd.read_excel(
+            file_path,
+            sheet_name=sheet_name,
+            engine='calamine',
+            nrows=nrows,
+            usecols=usecols,
+            dtype=dtype
+        )
+    
+    return pd.read_excel(
+        file_path,
+        sheet_name=sheet_name,
+        engine='openpyxl',
+        nrows=nrows,
+        usecols=usecols,
+        dtype=dtype,
+        **openpyxl_engine_kwargs(pd.read_excel)
+    )
+
+
+def read_sheet_columns(source: Union[str, pd.ExcelFile], sheet_name: str,
+                       header: List[Any], dtypes: Dict[str, Optional[str]]) -> pd.DataFrame:
+    """
+    Re-read a sheet keeping only the columns we use, typed up front.
+    
+    `header` is the raw header row (from a nrows=0 read) and `dtypes` maps
+    cleaned column names to the dtype they should be read as (None lets
+    pandas infer it).
+    """
+    positions = {str(col).strip(): i for i, col in enumerate(header)}
+    df = read_sheet(
+        source,
+        sheet_name,
+        usecols=sorted(positions[col] for col in dtypes),
+        dtype={header[positions[col]]: dtype for col, dtype in dtypes.items() if dtype}
+    )
+    
+    # Clean column names
+    df.columns = [str(col).strip() for col in df.columns]
+    return df
 
 
 def extract_month_columns(columns: List[str]) -> Dict[str, int]:
@@ -17,25 +158,62 @@ def extract_month_columns(columns: List[str]) -> Dict[str, int]:
     Extract month-based column names and their indices.
     Looks for patterns like 'July Capacity', 'August Capacity', etc.
     """
-    month_pattern = re.compile(
-        r'(January|February|March|April|May|June|July|August|September|October|November|December)\s*(Capacity|Hours|Forecast)?',
-        re.IGNORECASE
-    )
-    
     month_columns = {}
     for idx, col in enumerate(columns):
         if isinstance(col, str):
-            match = month_pattern.search(col)
+            match = MONTH_PATTERN.search(col)
             if match:
-                month_name = match.group(1).capitalize()[:3]  # Convert to 3-letter abbreviation
+                month_name = MONTH_ABBREV[match.group(1).lower()]
                 month_columns[month_name] = idx
     
     return month_columns
 
 
-def parse_capacity_sheet(file_path: str) -> Dict[str, Any]:
+def text_column(df: pd.DataFrame, col: Optional[str]) -> np.ndarray:
+    """
+    Return a column as an array of stripped strings, with "Unknown" for blanks.
+    
+    Values go through a categorical so each distinct string is stripped once
+    and rows share references into that small pool.
+    """
+    import numpy as np
+    
+    if col is None:
+        return np.full(len(df), "Unknown", dtype=object)
+    values = df[col].astype("string").astype("category")
+    
+    # Missing values have code -1, which picks the trailing "Unknown"
+    labels = np.append(values.cat.categories.str.strip().to_numpy(dtype=object), "Unknown")
+    return labels[values.cat.codes.to_numpy()]
+
+
+def month_values(df: pd.DataFrame, cols: List[str]) -> np.ndarray:
+    """
+    Return the given month columns as a float block, in `cols` order.
+    Blank and non-numeric cells (e.g. 'TBD') become 0.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    values = df.reindex(columns=cols).apply(pd.to_numeric, errors="coerce")
+    return np.nan_to_num(values.to_numpy(dtype=np.float64, copy=True), copy=False)
+
+
+def missing_mask(df: pd.DataFrame, col: Optional[str]) -> np.ndarray:
+    """
+    Return a boolean array marking rows where the column has no value.
+    """
+    import numpy as np
+    
+    if col is None:
+        return np.ones(len(df), dtype=bool)
+    return df[col].isna().to_numpy()
+
+
+def parse_capacity_sheet(source: Union[str, pd.ExcelFile]) -> Dict[str, Any]:
     """
     Parse the "Ref Role Grouping 23" sheet for capacity data.
+    `source` is a file path or a workbook from open_workbook().
     
     Returns:
         {
@@ -45,20 +223,19 @@ def parse_capacity_sheet(file_path: str) -> Dict[str, Any]:
                     "team": "Digital",
                     "role": "UX Designer",
                     "location": "Pune",
-                    "monthly_capacity": {"Jan": 160, "Feb": 160, ...}
+                    "capacity": [160, 160, ...]
                 },
                 ...
             ],
             "months": ["Jan", "Feb", "Mar", ...]
         }
+    
+    Each bucket's "capacity" list is aligned with "months".
     """
     try:
-        # Read the sheet
-        df = pd.read_excel(
-            file_path, 
-            sheet_name="Ref Role Grouping 23",
-            engine='openpyxl'
-        )
+        # Read just the header row to locate the columns we need
+        df = read_sheet(source, "Ref Role Grouping 23", nrows=0)
+        header = list(df.columns)
         
         # Clean column names
         df.columns = [str(col).strip() for col in df.columns]
@@ -85,44 +262,56 @@ def parse_capacity_sheet(file_path: str) -> Dict[str, Any]:
         if not location_col:
             location_col = df.columns[2] if len(df.columns) > 2 else None
             
-        # Find month columns
-        month_columns = extract_month_columns(list(df.columns))
+        # Find month columns, keyed to their column names
+        columns = list(df.columns)
+        month_columns = {
+            month: columns[col_idx]
+            for month, col_idx in extract_month_columns(columns).items()
+        }
         
-        # If no month columns found, look for numeric columns that might be capacity
-        if not month_columns:
-            months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+        if month_columns:
+            # Re-read only the key and month columns
+            dtypes = {col: "string" for col in (team_col, role_col, location_col) if col}
+            dtypes.update({col: None for col in month_columns.values()})
+            df = read_sheet_columns(source, "Ref Role Grouping 23", header, dtypes)
+        else:
+            # Column types are needed to guess, so read the full sheet
+            df = read_sheet(source, "Ref Role Grouping 23")
+            df.columns = [str(col).strip() for col in df.columns]
+            
+            # If no month columns found, look for numeric columns that might be capacity
             numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
             for i, col in enumerate(numeric_cols[:12]):  # Max 12 months
-                month_columns[months[i]] = list(df.columns).index(col)
-        
-        buckets = []
-        for idx, row in df.iterrows():
-            if pd.isna(row.get(team_col)) and pd.isna(row.get(role_col)):
-                continue  # Skip empty rows
-                
-            monthly_capacity = {}
-            for month, col_idx in month_columns.items():
-                col_name = df.columns[col_idx]
-                value = row.get(col_name, 0)
-                monthly_capacity[month] = float(value) if pd.notna(value) else 0
-            
-            bucket = {
-                "id": f"bucket_{idx}",
-                "team": str(row.get(team_col, "")).strip() if pd.notna(row.get(team_col)) else "Unknown",
-                "role": str(row.get(role_col, "")).strip() if pd.notna(row.get(role_col)) else "Unknown",
-                "location": str(row.get(location_col, "")).strip() if pd.notna(row.get(location_col)) else "Unknown",
-                "monthly_capacity": monthly_capacity
-            }
-            buckets.append(bucket)
+                month_columns[MONTH_ORDER[i]] = col
         
         # Get sorted list of months
-        month_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        available_months = sorted(
-            month_columns.keys(),
-            key=lambda x: month_order.index(x) if x in month_order else 12
-        )
+        available_months = [m for m in MONTH_ORDER if m in month_columns]
+        
+        # Pull the month values out as a single float block,
+        # with columns in the same order as available_months
+        month_block = month_values(df, [month_columns[m] for m in available_months])
+        
+        # Skip rows with neither a team nor a role
+        keep = ~(missing_mask(df, team_col) & missing_mask(df, role_col))
+        
+        kept = df[keep]
+        
+        teams = text_column(kept, team_col)
+        roles = text_column(kept, role_col)
+        locations = text_column(kept, location_col)
+        
+        buckets = [
+            {
+                "id": f"bucket_{idx}",
+                "team": team,
+                "role": role,
+                "location": location,
+                "capacity": values
+            }
+            for idx, team, role, location, values in zip(
+                kept.index, teams, roles, locations, month_block[keep].tolist()
+            )
+        ]
         
         return {
             "buckets": buckets,
@@ -138,9 +327,10 @@ def parse_capacity_sheet(file_path: str) -> Dict[str, Any]:
         raise ValueError(f"Error parsing capacity sheet: {str(e)}")
 
 
-def parse_demand_sheet(file_path: str) -> Dict[str, Any]:
+def parse_demand_sheet(source: Union[str, pd.ExcelFile]) -> Dict[str, Any]:
     """
     Parse the "Consolidated Data" sheet for project demand data.
+    `source` is a file path or a workbook from open_workbook().
     
     Returns:
         {
@@ -151,20 +341,22 @@ def parse_demand_sheet(file_path: str) -> Dict[str, Any]:
                     "team": "Digital",
                     "role": "UX Designer",
                     "location": "Pune",
-                    "monthly_demand": {"Jan": 80, "Feb": 120, ...}
+                    "demand": [80, 120, ...]
                 },
                 ...
             ],
             "months": ["Jan", "Feb", "Mar", ...]
         }
+    
+    Each project's "demand" list is aligned with "months".
     """
+    import numpy as np
+    import pandas as pd
+    
     try:
-        # Read the sheet
-        df = pd.read_excel(
-            file_path,
-            sheet_name="Consolidated Data",
-            engine='openpyxl'
-        )
+        # Read just the header row to locate the columns we need
+        df = read_sheet(source, "Consolidated Data", nrows=0)
+        header = list(df.columns)
         
         # Clean column names
         df.columns = [str(col).strip() for col in df.columns]
@@ -197,73 +389,92 @@ def parse_demand_sheet(file_path: str) -> Dict[str, Any]:
             location_col = df.columns[3] if len(df.columns) > 3 else None
         
         # Extract monthly demand columns (starting at index 26 as per requirements)
-        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        
         month_columns = {}
         # First, try to find named month columns
         for col in df.columns:
             if isinstance(col, str):
-                for month in months:
+                for month in MONTH_ORDER:
                     if month.lower() in col.lower():
                         month_columns[month] = col
                         break
         
         # If not enough month columns found, use columns starting at index 26
-        if len(month_columns) < 6:
+        start_idx = 26
+        positional = len(month_columns) < 6
+        full_read = positional and start_idx + len(MONTH_ORDER) > len(header)
+        if full_read:
+            # The header-only read can drop trailing columns whose header
+            # cell is blank (openpyxl), so read the full sheet for its width
+            df = read_sheet(source, "Consolidated Data")
+            df.columns = [str(col).strip() for col in df.columns]
+        if positional:
             month_columns = {}
-            start_idx = 26
-            for i, month in enumerate(months):
+            for i, month in enumerate(MONTH_ORDER):
                 if start_idx + i < len(df.columns):
                     month_columns[month] = df.columns[start_idx + i]
         
-        projects = []
-        project_names_seen = {}
+        if not full_read:
+            # Re-read only the key and month columns
+            dtypes = {
+                col: "string"
+                for col in (project_col, team_col, role_col, location_col) if col
+            }
+            dtypes.update({col: None for col in month_columns.values()})
+            df = read_sheet_columns(source, "Consolidated Data", header, dtypes)
         
-        for idx, row in df.iterrows():
-            project_name = row.get(project_col, "")
-            if pd.isna(project_name) or str(project_name).strip() == "":
-                continue
-                
-            project_name = str(project_name).strip()
-            
-            # Handle duplicate project names by adding suffix
-            if project_name in project_names_seen:
-                project_names_seen[project_name] += 1
-                unique_id = f"{project_name}_{project_names_seen[project_name]}"
-            else:
-                project_names_seen[project_name] = 0
-                unique_id = project_name
-            
-            monthly_demand = {}
-            for month, col in month_columns.items():
-                value = row.get(col, 0)
-                monthly_demand[month] = float(value) if pd.notna(value) else 0
-            
-            # Only include projects with some demand
-            if sum(monthly_demand.values()) > 0:
-                project = {
-                    "id": f"project_{idx}",
-                    "name": project_name,
-                    "uniqueId": unique_id,
-                    "team": str(row.get(team_col, "")).strip() if pd.notna(row.get(team_col)) else "Unknown",
-                    "role": str(row.get(role_col, "")).strip() if pd.notna(row.get(role_col)) else "Unknown",
-                    "location": str(row.get(location_col, "")).strip() if pd.notna(row.get(location_col)) else "Unknown",
-                    "monthly_demand": monthly_demand,
-                    "total_demand": sum(monthly_demand.values())
-                }
-                projects.append(project)
+        # Project names, skipping blank rows
+        if project_col is None:
+            names = pd.Series(pd.NA, index=df.index, dtype="string")
+        else:
+            names = df[project_col].astype("string").str.strip()
+        named = (names.notna() & (names != "")).to_numpy()
         
-        # Sort projects by total demand (highest first) for initial priority
-        projects.sort(key=lambda x: x['total_demand'], reverse=True)
+        # Handle duplicate project names by adding suffix (_1, _2, ...)
+        named_names = names[named]
+        suffix = named_names.groupby(named_names, sort=False).cumcount().to_numpy()
+        unique_ids = np.empty(len(df), dtype=object)
+        unique_ids[named] = np.where(
+            suffix == 0,
+            named_names.to_numpy(dtype=object),
+            (named_names + "_" + suffix.astype(str)).to_numpy(dtype=object)
+        )
+        names = names.to_numpy(dtype=object)
         
         # Get sorted list of months
-        month_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        available_months = sorted(
-            month_columns.keys(),
-            key=lambda x: month_order.index(x) if x in month_order else 12
-        )
+        available_months = [m for m in MONTH_ORDER if m in month_columns]
+        
+        # Month values as one float block, columns ordered like available_months
+        month_block = month_values(df, [month_columns[m] for m in available_months])
+        total_demand = month_block.sum(axis=1)
+        
+        # Only include projects with some demand; filter before any
+        # per-row string work so discarded rows cost nothing further
+        keep = named & (total_demand > 0)
+        kept = df[keep]
+        
+        teams = text_column(kept, team_col)
+        roles = text_column(kept, role_col)
+        locations = text_column(kept, location_col)
+        
+        projects = [
+            {
+                "id": f"project_{idx}",
+                "name": name,
+                "uniqueId": unique_id,
+                "team": team,
+                "role": role,
+                "location": location,
+                "demand": values,
+                "total_demand": total
+            }
+            for idx, name, unique_id, team, role, location, values, total in zip(
+                kept.index, names[keep], unique_ids[keep], teams, roles, locations,
+                month_block[keep].tolist(), total_demand[keep].tolist()
+            )
+        ]
+        
+        # Sort projects by total demand (highest first) for initial priority
+        projects.sort(key=lambda x: x['total_demand'], reverse=True)
         
         return {
             "projects": projects,
@@ -280,10 +491,16 @@ def parse_demand_sheet(file_path: str) -> Dict[str, Any]:
         raise ValueError(f"Error parsing demand sheet: {str(e)}")
 
 
-def parse_excel_file(file_path: str) -> Dict[str, Any]:
+def parse_excel_file(file_path: str,
+                     cache_key: Optional[Tuple[str, int]] = None,
+                     file_name: Optional[str] = None) -> Dict[str, Any]:
     """
     Parse the complete Excel file and return structured data for the frontend.
     
+    If `cache_key` (content hash, size) is given, the parsed sheets are cached
+    and a repeat upload of the same file skips parsing entirely. `file_name`
+    overrides the reported name when `file_path` is a temporary file.
+    
     Returns:
         {
             "capacity": {...},
@@ -296,93 +513,113 @@ def parse_excel_file(file_path: str) -> Dict[str, Any]:
     """
     import os
     
-    capacity_data = parse_capacity_sheet(file_path)
-    demand_data = parse_demand_sheet(file_path)
-    
-    # Merge months from both sources
-    all_months = list(set(capacity_data['months'] + demand_data['months']))
-    month_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    all_months.sort(key=lambda x: month_order.index(x) if x in month_order else 12)
+    parsed = _parse_cache.get(cache_key) if cache_key is not None else None
+    if parsed is not None:
+        _parse_cache.move_to_end(cache_key)
+        # Hand out a private copy so callers can't mutate the cached entry
+        parsed = copy.deepcopy(parsed)
+    else:
+        # Open the workbook once and parse both sheets from it
+        try:
+            workbook = open_workbook(file_path)
+        except Exception as e:
+            raise ValueError(f"Error opening workbook: {str(e)}")
+        
+        with workbook:
+            capacity_data = parse_capacity_sheet(workbook)
+            demand_data = parse_demand_sheet(workbook)
+        
+        # Merge months from both sources
+        merged = set(capacity_data['months']) | set(demand_data['months'])
+        all_months = [m for m in MONTH_ORDER if m in merged]
+        
+        parsed = {
+            "capacity": capacity_data,
+            "demand": demand_data,
+            "months": all_months
+        }
+        if cache_key is not None:
+            _parse_cache[cache_key] = copy.deepcopy(parsed)
+            if len(_parse_cache) > PARSE_CACHE_SIZE:
+                _parse_cache.popitem(last=False)
     
+    # Metadata is per request so timestamps and file names stay fresh
     return {
-        "capacity": capacity_data,
-        "demand": demand_data,
-        "months": all_months,
+        **parsed,
         "metadata": {
             "parsed_at": datetime.now().isoformat(),
-            "file_name": os.path.basename(file_path)
+            "file_name": file_name or os.path.basename(file_path)
         }
     }
 
 
-def generate_demo_data() -> Dict[str, Any]:
+def _build_demo_data() -> Dict[str, Any]:
     """
-    Generate demo data for testing when no Excel file is available.
+    Build the static part of the demo payload (everything but parsed_at).
     """
     months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']
     
     # Sample capacity buckets
     buckets = [
         {"id": "bucket_0", "team": "Digital", "role": "UX Designer", "location": "London", 
-         "monthly_capacity": {m: 320 for m in months}},
+         "capacity": [320] * len(months)},
         {"id": "bucket_1", "team": "Digital", "role": "UX Designer", "location": "Pune", 
-         "monthly_capacity": {m: 480 for m in months}},
+         "capacity": [480] * len(months)},
         {"id": "bucket_2", "team": "Digital", "role": "Developer", "location": "London", 
-         "monthly_capacity": {m: 640 for m in months}},
+         "capacity": [640] * len(months)},
         {"id": "bucket_3", "team": "Digital", "role": "Developer", "location": "Pune", 
-         "monthly_capacity": {m: 960 for m in months}},
+         "capacity": [960] * len(months)},
         {"id": "bucket_4", "team": "Strategy", "role": "Consultant", "location": "London", 
-         "monthly_capacity": {m: 480 for m in months}},
+         "capacity": [480] * len(months)},
         {"id": "bucket_5", "team": "Strategy", "role": "Consultant", "location": "New York", 
-         "monthly_capacity": {m: 320 for m in months}},
+         "capacity": [320] * len(months)},
         {"id": "bucket_6", "team": "Analytics", "role": "Data Analyst", "location": "Pune", 
-         "monthly_capacity": {m: 480 for m in months}},
+         "capacity": [480] * len(months)},
         {"id": "bucket_7", "team": "Analytics", "role": "Data Analyst", "location": "London", 
-         "monthly_capacity": {m: 320 for m in months}},
+         "capacity": [320] * len(months)},
     ]
     
     # Sample projects
     projects = [
         {"id": "project_0", "name": "Project Alpha", "uniqueId": "Project Alpha", 
          "team": "Digital", "role": "UX Designer", "location": "London",
-         "monthly_demand": {"Jan": 200, "Feb": 180, "Mar": 160, "Apr": 140, "May": 120, "Jun": 100},
+         "demand": [200, 180, 160, 140, 120, 100],
          "total_demand": 900},
         {"id": "project_1", "name": "Project Beta", "uniqueId": "Project Beta", 
          "team": "Digital", "role": "UX Designer", "location": "Pune",
-         "monthly_demand": {"Jan": 300, "Feb": 350, "Mar": 400, "Apr": 350, "May": 300, "Jun": 250},
+         "demand": [300, 350, 400, 350, 300, 250],
          "total_demand": 1950},
         {"id": "project_2", "name": "Project Gamma", "uniqueId": "Project Gamma", 
          "team": "Digital", "role": "Developer", "location": "London",
-         "monthly_demand": {"Jan": 400, "Feb": 450, "Mar": 500, "Apr": 450, "May": 400, "Jun": 350},
+         "demand": [400, 450, 500, 450, 400, 350],
          "total_demand": 2550},
         {"id": "project_3", "name": "Project Delta", "uniqueId": "Project Delta", 
          "team": "Digital", "role": "Developer", "location": "Pune",
-         "monthly_demand": {"Jan": 600, "Feb": 700, "Mar": 800, "Apr": 750, "May": 650, "Jun": 550},
+         "demand": [600, 700, 800, 750, 650, 550],
          "total_demand": 4050},
         {"id": "project_4", "name": "Project Epsilon", "uniqueId": "Project Epsilon", 
          "team": "Strategy", "role": "Consultant", "location": "London",
-         "monthly_demand": {"Jan": 250, "Feb": 300, "Mar": 350, "Apr": 300, "May": 250, "Jun": 200},
+         "demand": [250, 300, 350, 300, 250, 200],
          "total_demand": 1650},
         {"id": "project_5", "name": "Project Zeta", "uniqueId": "Project Zeta", 
          "team": "Strategy", "role": "Consultant", "location": "New York",
-         "monthly_demand": {"Jan": 180, "Feb": 200, "Mar": 220, "Apr": 200, "May": 180, "Jun": 160},
+         "demand": [180, 200, 220, 200, 180, 160],
          "total_demand": 1140},
         {"id": "project_6", "name": "Project Eta", "uniqueId": "Project Eta", 
          "team": "Analytics", "role": "Data Analyst", "location": "Pune",
-         "monthly_demand": {"Jan": 300, "Feb": 350, "Mar": 400, "Apr": 380, "May": 340, "Jun": 300},
+         "demand": [300, 350, 400, 380, 340, 300],
          "total_demand": 2070},
         {"id": "project_7", "name": "Project Theta", "uniqueId": "Project Theta", 
          "team": "Analytics", "role": "Data Analyst", "location": "London",
-         "monthly_demand": {"Jan": 200, "Feb": 220, "Mar": 250, "Apr": 230, "May": 210, "Jun": 190},
+         "demand": [200, 220, 250, 230, 210, 190],
          "total_demand": 1300},
         {"id": "project_8", "name": "Project Iota", "uniqueId": "Project Iota", 
          "team": "Digital", "role": "UX Designer", "location": "London",
-         "monthly_demand": {"Jan": 150, "Feb": 160, "Mar": 170, "Apr": 160, "May": 150, "Jun": 140},
+         "demand": [150, 160, 170, 160, 150, 140],
          "total_demand": 930},
         {"id": "project_9", "name": "Project Kappa", "uniqueId": "Project Kappa", 
          "team": "Digital", "role": "Developer", "location": "Pune",
-         "monthly_demand": {"Jan": 500, "Feb": 550, "Mar": 600, "Apr": 580, "May": 520, "Jun": 480},
+         "demand": [500, 550, 600, 580, 520, 480],
          "total_demand": 3230},
     ]
     
@@ -399,8 +636,24 @@ def generate_demo_data() -> Dict[str, Any]:
         },
         "months": months,
         "metadata": {
-            "parsed_at": datetime.now().isoformat(),
             "file_name": "demo_data.xlsm",
             "is_demo": True
         }
     }
+
+
+# Demo data never changes, so build it once; only the timestamp is per call
+_DEMO_PAYLOAD = _build_demo_data()
+
+
+def generate_demo_data() -> Dict[str, Any]:
+    """
+    Generate demo data for testing when no Excel file is available.
+    """
+    return {
+        **_DEMO_PAYLOAD,
+        "metadata": {
+            **_DEMO_PAYLOAD["metadata"],
+            "parsed_at": datetime.now().isoformat()
+        }
+    }
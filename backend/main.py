@@ -6,13 +6,18 @@ FastAPI server for Excel file ingestion and data processing.
 
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
+import hashlib
+import orjson
 import tempfile
 import os
-import shutil
 
 from excel_parser import parse_excel_file, generate_demo_data
 
+# Read uploads in 1 MiB chunks to keep syscalls down on large workbooks
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 app = FastAPI(
     title="What-If Simulation Dashboard API",
     description="Backend API for capacity planning simulation",
@@ -28,6 +33,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses; parsed workbooks are large, highly repetitive JSON
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 @app.get("/")
 async def root():
@@ -71,22 +79,36 @@ async def upload_file(file: UploadFile = File(...)):
         )
     
     # Create a temporary file to store the upload
-    temp_dir = tempfile.mkdtemp()
-    temp_file_path = os.path.join(temp_dir, file.filename)
+    temp_file = tempfile.NamedTemporaryFile(
+        delete=False,
+        suffix=os.path.splitext(file.filename)[1]
+    )
     
     try:
-        # Save uploaded file
-        with open(temp_file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Save uploaded file, hashing it on the way for the parse cache
+        digest = hashlib.sha1()
+        size = 0
+        with temp_file as buffer:
+            while chunk := file.file.read(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                buffer.write(chunk)
+                size += len(chunk)
         
-        # Parse the Excel file
-        data = parse_excel_file(temp_file_path)
+        # Parse the Excel file (cached by content)
+        data = parse_excel_file(
+            temp_file.name,
+            cache_key=(digest.hexdigest(), size),
+            file_name=file.filename
+        )
         
-        return JSONResponse(content={
-            "success": True,
-            "data": data,
-            "message": f"Successfully parsed {file.filename}"
-        })
+        return Response(
+            content=orjson.dumps({
+                "success": True,
+                "data": data,
+                "message": f"Successfully parsed {file.filename}"
+            }),
+            media_type="application/json"
+        )
         
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
@@ -96,9 +118,9 @@ async def upload_file(file: UploadFile = File(...)):
             detail=f"Error processing file: {str(e)}"
         )
     finally:
-        # Clean up temporary files
+        # Clean up temporary file
         try:
-            shutil.rmtree(temp_dir)
+            os.unlink(temp_file.name)
         except:
             pass
 
@@ -112,11 +134,14 @@ async def get_demo_data():
     """
     try:
         data = generate_demo_data()
-        return JSONResponse(content={
-            "success": True,
-            "data": data,
-            "message": "Demo data loaded successfully"
-        })
+        return Response(
+            content=orjson.dumps({
+                "success": True,
+                "data": data,
+                "message": "Demo data loaded successfully"
+            }),
+            media_type="application/json"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -0,0 +1,160 @@
+"""
+Regression tests for the Excel parser.
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+
+import openpyxl
+import pytest
+
+import excel_parser
+
+
+@pytest.fixture(params=["openpyxl", "default"])
+def engine(request, monkeypatch):
+    """Run each test on the openpyxl path and on the default engine."""
+    if request.param == "openpyxl":
+        monkeypatch.setattr(excel_parser, "calamine_available", lambda: False)
+    return request.param
+
+
+def save_workbook(path, capacity_rows, demand_rows):
+    """Write a workbook with the two sheets the parser reads."""
+    workbook = openpyxl.Workbook()
+    capacity = workbook.active
+    capacity.title = "Ref Role Grouping 23"
+    for row in capacity_rows:
+        capacity.append(row)
+    
+    demand = workbook.create_sheet("Consolidated Data")
+    for row in demand_rows:
+        demand.append(row)
+    
+    workbook.save(path)
+    return str(path)
+
+
+def test_positional_month_columns_with_blank_headers(tmp_path, engine):
+    # Month demand sits in columns 26-37 with no header text at all
+    file_path = save_workbook(
+        tmp_path / "blank_headers.xlsx",
+        [
+            ["Global Team", "Role Group", "Location", "January Capacity"],
+            ["Digital", "Developer", "Pune", 160],
+        ],
+        [["Project", "Global Team", "Role Group", "Location"]] + [
+            [f"Project {i}", "Digital", "Developer", "Pune"] + [None] * 22 + [i + 1] * 12
+            for i in range(4)
+        ]
+    )
+    
+    data = excel_parser.parse_excel_file(file_path)
+    
+    assert data["demand"]["months"] == excel_parser.MONTH_ORDER
+    projects = data["demand"]["projects"]
+    assert [p["name"] for p in projects] == ["Project 3", "Project 2", "Project 1", "Project 0"]
+    assert projects[0]["demand"] == [4.0] * 12
+    assert projects[0]["total_demand"] == 48.0
+
+
+def test_monthly_values_align_with_months(tmp_path, engine):
+    # Month headers out of calendar order on both sheets
+    file_path = save_workbook(
+        tmp_path / "unordered_months.xlsx",
+        [
+            ["Global Team", "Role Group", "Location",
+             "March Capacity", "February Capacity", "January Capacity"],
+            ["Digital", "Developer", "Pune", 3, 2, 1],
+        ],
+        [
+            ["Project", "Global Team", "Role Group", "Location",
+             "Mar Forecast", "Feb Forecast", "Jan Forecast",
+             "Jun Forecast", "May Forecast", "Apr Forecast"],
+            ["Alpha", "Digital", "Developer", "Pune", 30, 20, 10, 60, 50, 40],
+        ]
+    )
+    
+    data = excel_parser.parse_excel_file(file_path)
+    
+    capacity = data["capacity"]
+    assert capacity["months"] == ["Jan", "Feb", "Mar"]
+    assert capacity["buckets"][0]["capacity"] == [1.0, 2.0, 3.0]
+    
+    demand = data["demand"]
+    assert demand["months"] == ["Jan", "Feb", "Mar", "Apr", "May", "Jun"]
+    assert demand["projects"][0]["demand"] == [10.0, 20.0, 30.0, 40.0, 50.0, 60.0]
+    
+    assert data["months"] == ["Jan", "Feb", "Mar", "Apr", "May", "Jun"]
+
+
+def test_duplicate_project_names_get_suffixes(tmp_path, engine):
+    months = ["Jan Forecast", "Feb Forecast", "Mar Forecast",
+              "Apr Forecast", "May Forecast", "Jun Forecast"]
+    file_path = save_workbook(
+        tmp_path / "duplicates.xlsx",
+        [
+            ["Global Team", "Role Group", "Location", "January Capacity"],
+            ["Digital", "Developer", "Pune", 160],
+        ],
+        [
+            ["Project", "Global Team", "Role Group", "Location"] + months,
+            ["A", "Digital", "Developer", "Pune"] + [1] * 6,
+            ["   ", "Digital", "Developer", "Pune"] + [1] * 6,
+            [" A ", "Digital", "Developer", "Pune"] + [0] * 6,
+            [None, "Digital", "Developer", "Pune"] + [1] * 6,
+            ["A", "Digital", "Developer", "Pune"] + [2] * 6,
+            ["B", "Digital", "Developer", "Pune"] + [3] * 6,
+        ]
+    )
+    
+    data = excel_parser.parse_excel_file(file_path)
+    
+    # Blank names are skipped; the zero-demand " A " is dropped but still
+    # uses up the "A_1" suffix
+    projects = {p["id"]: (p["name"], p["uniqueId"]) for p in data["demand"]["projects"]}
+    assert projects == {
+        "project_0": ("A", "A"),
+        "project_4": ("A", "A_2"),
+        "project_5": ("B", "B"),
+    }
+
+
+def test_cache_hit_skips_parsing(tmp_path, monkeypatch):
+    monkeypatch.setattr(excel_parser, "_parse_cache", OrderedDict())
+    file_path = save_workbook(
+        tmp_path / "cached.xlsx",
+        [
+            ["Global Team", "Role Group", "Location", "January Capacity"],
+            ["Digital", "Developer", "Pune", 160],
+        ],
+        [
+            ["Project", "Global Team", "Role Group", "Location"] + [None] * 22 + [None] * 12,
+            ["Alpha", "Digital", "Developer", "Pune"] + [None] * 22 + [10] * 12,
+        ]
+    )
+    cache_key = ("abc123", 42)
+    
+    first = excel_parser.parse_excel_file(file_path, cache_key=cache_key, file_name="first.xlsx")
+    
+    def fail_open(file_path):
+        raise AssertionError("cache hit should not open the workbook")
+    monkeypatch.setattr(excel_parser, "open_workbook", fail_open)
+    
+    class LaterDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2030, 1, 1, 12, 0, 0)
+    monkeypatch.setattr(excel_parser, "datetime", LaterDatetime)
+    
+    # Mutating a returned payload must not leak into the cache
+    first["capacity"]["buckets"][0]["capacity"][0] = -1
+    first["demand"]["projects"].clear()
+    
+    second = excel_parser.parse_excel_file(file_path, cache_key=cache_key, file_name="second.xlsx")
+    
+    assert second["capacity"]["buckets"][0]["capacity"] == [160.0]
+    assert [p["name"] for p in second["demand"]["projects"]] == ["Alpha"]
+    assert second["metadata"]["file_name"] == "second.xlsx"
+    assert second["metadata"]["parsed_at"] == "2030-01-01T12:00:00"
+    assert first["metadata"]["file_name"] == "first.xlsx"
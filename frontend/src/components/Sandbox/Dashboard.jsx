@@ -3,13 +3,17 @@ import PrioritySlider from './PrioritySlider'
 import VirtualCapacity from './VirtualCapacity'
 import Heatmap from './Heatmap'
 import DeltaCounter from './DeltaCounter'
-import { calculateScenario, getUniqueValues } from '../../engine/calculator'
+import { calculateScenario, expandMonthlyValues, getUniqueValues } from '../../engine/calculator'
 import { exportScenarioToPDF } from '../../utils/pdfExport'
 
 export default function Dashboard({ data, onReset }) {
     // Extract baseline data
-    const baselineCapacity = useMemo(() => data.capacity.buckets, [data])
-    const baselineProjects = useMemo(() => data.demand.projects, [data])
+    const baselineCapacity = useMemo(() => expandMonthlyValues(
+        data.capacity.buckets, 'capacity', 'monthly_capacity', data.capacity.months
+    ), [data])
+    const baselineProjects = useMemo(() => expandMonthlyValues(
+        data.demand.projects, 'demand', 'monthly_demand', data.demand.months
+    ), [data])
     const months = useMemo(() => data.months, [data])
     const metadata = useMemo(() => data.metadata, [data])
 
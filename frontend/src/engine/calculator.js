@@ -12,6 +12,31 @@ export function getBucketKey(team, role, location) {
     return `${team}|${role}|${location}`.toLowerCase();
 }
 
+/**
+ * Expand month-aligned value arrays (as sent by the API) into month-keyed objects
+ *
+ * e.g. { capacity: [160, 120] } with months ['Jan', 'Feb']
+ *   -> { capacity: [160, 120], monthly_capacity: { Jan: 160, Feb: 120 } }
+ * Items that already carry the month-keyed object are returned unchanged.
+ */
+export function expandMonthlyValues(items, arrayKey, objectKey, months) {
+    return items.map(item => {
+        if (item[objectKey] || !item[arrayKey]) {
+            return item;
+        }
+
+        const monthlyValues = {};
+        months.forEach((month, idx) => {
+            monthlyValues[month] = item[arrayKey][idx] || 0;
+        });
+
+        return {
+            ...item,
+            [objectKey]: monthlyValues
+        };
+    });
+}
+
 /**
  * Calculate effective capacity (baseline + virtual resources)
  */